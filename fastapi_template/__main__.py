@@ -1,26 +1,44 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, TYPE_CHECKING
 
-from cookiecutter.exceptions import (FailedHookException,
-                                     OutputDirExistsException)
-from cookiecutter.main import cookiecutter
-from termcolor import cprint
-from fastapi_template.cli import run_command
-from fastapi_template.input_model import BuilderContext
+if TYPE_CHECKING:
+    from fastapi_template.input_model import BuilderContext
 
 script_dir = Path(__file__).parent
 
 
-def generate_project(context: BuilderContext) -> None:
+@lru_cache(maxsize=1)
+def _default_config() -> Dict[str, Any]:
+    """
+    Build default config for cookiecutter.
+
+    The default config never changes within a process,
+    so it's computed only once.
+
+    :return: dict with default generation parameters.
+    """
+    from fastapi_template.input_model import BuilderContext
+
+    return BuilderContext().dict()
+
+
+def generate_project(context: "BuilderContext") -> None:
     """
     Generate actual project with given context.
 
     :param context: builder_context
     """
+    from cookiecutter.exceptions import (FailedHookException,
+                                         OutputDirExistsException)
+    from cookiecutter.main import cookiecutter
+    from termcolor import cprint
+
     try:
         cookiecutter(
             template=f"{script_dir}/template",
             extra_context=context.dict(),
-            default_config=BuilderContext().dict(),
+            default_config=dict(_default_config()),
             no_input=True,
             overwrite_if_exists=context.force,
         )
@@ -35,6 +53,8 @@ def generate_project(context: BuilderContext) -> None:
 
 def main() -> None:
     """Starting point."""
+    from fastapi_template.cli import run_command
+
     run_command(generate_project)
 
 
@@ -4,9 +4,6 @@ from importlib.metadata import version
 from typing import Any, Callable, List, Optional
 
 from click import Command, Option
-from prompt_toolkit import prompt
-from prompt_toolkit.document import Document
-from prompt_toolkit.validation import ValidationError, Validator
 from termcolor import colored
 
 from fastapi_template.input_model import (
@@ -20,11 +17,29 @@ from fastapi_template.input_model import (
 )
 
 
-class SnakeCaseValidator(Validator):
-    def validate(self, document: Document):
-        text = document.text
-        if not text or re.fullmatch(r"[a-zA-Z][\w\_\d]*", text) is None:
-            raise ValidationError(message="Must be a valid snake_case name.")
+def prompt_project_name() -> str:
+    """
+    Interactively ask for a project name.
+
+    prompt_toolkit is imported here, so runs that pass
+    the name via --name never load it.
+
+    :return: entered project name.
+    """
+    from prompt_toolkit import prompt
+    from prompt_toolkit.document import Document
+    from prompt_toolkit.validation import ValidationError, Validator
+
+    class SnakeCaseValidator(Validator):
+        def validate(self, document: Document):
+            text = document.text
+            if not text or re.fullmatch(r"[a-zA-Z][\w\_\d]*", text) is None:
+                raise ValidationError(message="Must be a valid snake_case name.")
+
+    return prompt(
+        "Project name: ",
+        validator=SnakeCaseValidator(),
+    )
 
 
 def db_menu_update_info(ctx: BuilderContext, menu: SingularMenuModel) -> BuilderContext:
@@ -67,13 +82,13 @@ def check_orm(allowed_values: List[str]) -> Callable[[BuilderContext], bool]:
     return checker
 
 
-api_menu = SingularMenuModel(
+api_menu = SingularMenuModel.model_construct(
     title="API type",
     code="api_type",
     cli_name="api-type",
     description="Select API type for your application",
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="rest",
             user_view="REST API",
             description=(
@@ -85,7 +100,7 @@ api_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="graphql",
             user_view="GrapQL API",
             pydantic_v1=True,
@@ -102,13 +117,13 @@ api_menu = SingularMenuModel(
     ],
 )
 
-db_menu = SingularMenuModel(
+db_menu = SingularMenuModel.model_construct(
     title="Database",
     code="db",
     description="Select a database for your app",
     after_ask_fun=db_menu_update_info,
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="none",
             user_view="No database",
             description="This project doesn't need a database.",
@@ -120,7 +135,7 @@ db_menu = SingularMenuModel(
                 port=None,
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="sqlite",
             user_view="SQLite database",
             description=(
@@ -145,7 +160,7 @@ db_menu = SingularMenuModel(
                 port=None,
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="mysql",
             user_view="MySQL database",
             description=(
@@ -165,7 +180,7 @@ db_menu = SingularMenuModel(
                 port=3306,
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="postgresql",
             user_view="PostgreSQL database",
             description=(
@@ -188,18 +203,18 @@ db_menu = SingularMenuModel(
     ],
 )
 
-ci_menu = SingularMenuModel(
+ci_menu = SingularMenuModel.model_construct(
     title="CI|CD",
     code="ci_type",
     cli_name="ci",
     description="Select a CI for your app",
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="none",
             user_view="Do not add CI/CD.",
             description="This project doesn't need to have CI/CD.",
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="gitlab_ci",
             user_view="Gitlab CI",
             description=(
@@ -218,7 +233,7 @@ ci_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="github",
             user_view="Github Actions",
             description=(
@@ -234,14 +249,14 @@ ci_menu = SingularMenuModel(
     ],
 )
 
-orm_menu = SingularMenuModel(
+orm_menu = SingularMenuModel.model_construct(
     title="ORM",
     code="orm",
     description="Choose Object–Relational Mapper lib",
     cli_name="orm",
     before_ask_fun=disable_orm,
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="none",
             user_view="Whithout ORMs",
             description=(
@@ -253,7 +268,7 @@ orm_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="ormar",
             user_view="Ormar",
             pydantic_v1=True,
@@ -265,7 +280,7 @@ orm_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="sqlalchemy",
             user_view="SQLAlchemy",
             description=(
@@ -276,7 +291,7 @@ orm_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="tortoise",
             user_view="Tortoise",
             description=(
@@ -287,7 +302,7 @@ orm_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="psycopg",
             user_view="PsycoPG",
             is_hidden=check_db(["postgresql"]),
@@ -299,7 +314,7 @@ orm_menu = SingularMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="piccolo",
             user_view="Piccolo",
             pydantic_v1=True,
@@ -315,20 +330,20 @@ orm_menu = SingularMenuModel(
     ],
 )
 
-features_menu = MultiselectMenuModel(
+features_menu = MultiselectMenuModel.model_construct(
     title="Additional tweaks",
     code="features",
     description="Additional project features",
     multiselect=True,
     before_ask=do_not_ask_features_if_quite,
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="pydanticv1",
             cli_name="pydantic-v1",
             user_view="Use older version of pydantic",
             description="Use pydantic version ^1 instead of ^2",
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_redis",
             cli_name="redis",
             user_view="Add redis support",
@@ -345,7 +360,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="add_users",
             cli_name="add_users",
             user_view="Add fastapi-users support",
@@ -362,7 +377,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_rmq",
             cli_name="rabbit",
             user_view="Add RabbitMQ support",
@@ -375,7 +390,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_taskiq",
             cli_name="taskiq",
             user_view="Add Taskiq support",
@@ -390,7 +405,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_migrations",
             cli_name="migrations",
             user_view="Add Migrations",
@@ -403,7 +418,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_kube",
             cli_name="kube",
             user_view="Add kubernetes configs",
@@ -416,7 +431,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="add_dummy",
             cli_name="dummy",
             user_view="Add dummy model",
@@ -429,7 +444,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_routers",
             cli_name="routers",
             user_view="Add example routers",
@@ -440,7 +455,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="self_hosted_swagger",
             cli_name="swagger",
             user_view="Add self hosted swagger",
@@ -452,7 +467,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="prometheus_enabled",
             cli_name="prometheus",
             user_view="Add prometheus compatible metrics",
@@ -464,7 +479,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="sentry_enabled",
             cli_name="sentry",
             user_view="Add sentry integration",
@@ -480,7 +495,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_loguru",
             cli_name="loguru",
             user_view="Add loguru logger",
@@ -496,7 +511,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="otlp_enabled",
             cli_name="opentelemetry",
             user_view="Add opentelemetry integration",
@@ -515,7 +530,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="traefik_labels",
             cli_name="traefik",
             user_view="Adds traefik labels to docker container",
@@ -534,7 +549,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="enable_kafka",
             cli_name="kafka",
             user_view="Add Kafka support",
@@ -549,7 +564,7 @@ features_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="gunicorn",
             cli_name="gunicorn",
             user_view="Add gunicorn server",
@@ -563,14 +578,14 @@ features_menu = MultiselectMenuModel(
     ],
 )
 
-users_backend_menu = MultiselectMenuModel(
+users_backend_menu = MultiselectMenuModel.model_construct(
     title="FastApi Users Backend",
     code="users_menu",
     description="Available backends for authentication with fastapi_users",
     multiselect=True,
     before_ask=do_not_ask_features_if_no_users,
     entries=[
-        MenuEntry(
+        MenuEntry.model_construct(
             code="cookie_auth",
             cli_name="cookie auth",
             user_view="Add authentication via cookie support",
@@ -583,7 +598,7 @@ users_backend_menu = MultiselectMenuModel(
                 )
             ),
         ),
-        MenuEntry(
+        MenuEntry.model_construct(
             code="jwt_auth",
             cli_name="jwt auth",
             user_view="Add JWT auth support",
@@ -612,10 +627,7 @@ def handle_cli(
         context = BuilderContext(**cli_args)
 
         if context.project_name is None:
-            context.project_name = prompt(
-                "Project name: ",
-                validator=SnakeCaseValidator(),
-            )
+            context.project_name = prompt_project_name()
         context.kube_name = context.project_name.replace("_", "-")
 
         for menu in menus:
@@ -1,19 +1,63 @@
 import abc
 import enum
-from collections import UserDict
+import operator
+import sys
+from dataclasses import asdict, dataclass
+from functools import cached_property
 from typing import Any, Callable, List, Optional
 import click
 
-from prompt_toolkit.shortcuts import checkboxlist_dialog, radiolist_dialog
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-try:
-    from simple_term_menu import TerminalMenu
-except Exception:
-    TerminalMenu = None
+# C-level attribute extractors for hot per-entry loops.
+_USER_VIEW = operator.attrgetter("user_view")
+_GEN_NAME = operator.attrgetter("generated_name")
 
+_MISSING = object()
 
-class Database(BaseModel):
+_TERMINAL_MENU: Any = None
+_TERMINAL_MENU_PROBED = False
+
+
+def _terminal_menu() -> Any:
+    """
+    Import TerminalMenu on first use.
+
+    Both simple_term_menu and prompt_toolkit are only needed
+    when a menu is actually shown, so they are not imported
+    at module load.
+
+    :return: TerminalMenu class or None if it's unavailable.
+    """
+    global _TERMINAL_MENU, _TERMINAL_MENU_PROBED
+    if not _TERMINAL_MENU_PROBED:
+        _TERMINAL_MENU_PROBED = True
+        try:
+            from simple_term_menu import TerminalMenu
+        except Exception:
+            _TERMINAL_MENU = None
+        else:
+            _TERMINAL_MENU = TerminalMenu
+    return _TERMINAL_MENU
+
+
+class _CachedChoice(click.Choice):
+    """click.Choice with a precomputed case-insensitive lookup."""
+
+    def __init__(self, choices: tuple[str, ...]) -> None:
+        super().__init__(choices, case_sensitive=False)
+        self._canonical = {choice.lower(): choice for choice in choices}
+
+    def convert(self, value: Any, param: Any, ctx: Any) -> Any:
+        found = self._canonical.get(str(value).lower())
+        if found is not None:
+            return found
+        # Unknown value: let click produce its usual error message.
+        return super().convert(value, param, ctx)
+
+
+@dataclass(frozen=True)
+class Database:
     name: str
     image: Optional[str] = None
     driver: Optional[str] = None
@@ -21,17 +65,22 @@ class Database(BaseModel):
     port: Optional[int] = None
     driver_short: Optional[str] = None
 
+    def dict(self) -> dict[str, Any]:
+        return asdict(self)
+
 
 class MenuEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True, extra="forbid")
+
     code: str
     cli_name: Optional[str] = None
     user_view: str
     description: str
-    is_hidden: Optional[Callable[["BuilderContext"], bool]] = None
+    is_hidden: Optional[Callable[..., bool]] = None
     additional_info: Any = None
     pydantic_v1: bool = False
 
-    @property
+    @cached_property
     def generated_name(self) -> str:
         """
         Property to generate parameter name.
@@ -41,40 +90,12 @@ class MenuEntry(BaseModel):
 
         :return: string to use in CLI.
         """
-        # sample commit
         if self.cli_name:
             return self.cli_name
         return self.code
 
-    @property
-    def generated_name(self, param1: str) -> str:
-        """
-        Property to generate parameter name.
-
-        It checks if cli_name is present,
-        otherwise, code is used.
-
-        :return: string to use in CLI.
-        """
-        if self.cli_name:
-            return self.cli_name
-        return self.code
-
-    @property
-    def generated_name(self, param1: str, param2: str) -> str:
-        """
-        Property to generate parameter name.
-
-        It checks if cli_name is present,
-        otherwise, code is used.
-
-        :return: string to use in CLI.
-        """
-        if self.cli_name:
-            return self.cli_name
-        return self.code
-
-SKIP_ENTRY = MenuEntry(
+# Trusted in-code literal, so the full validation pass is skipped.
+SKIP_ENTRY = MenuEntry.model_construct(
     code="skip",
     user_view="skip",
     description="skip",
@@ -82,28 +103,34 @@ SKIP_ENTRY = MenuEntry(
 
 
 class BaseMenuModel(BaseModel, abc.ABC):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     title: str
     entries: List[MenuEntry]
     description: str = ""
 
-    def _preview(self, current_value: str):
+    @cached_property
+    def _preview_map(self) -> dict[str, str]:
+        return {entry.user_view: entry.description for entry in self.entries}
+
+    @cached_property
+    def _by_code(self) -> dict[str, MenuEntry]:
+        return {entry.code: entry for entry in self.entries}
 
-        for entry in self.entries:
-            if entry.user_view == current_value:
-                return entry.description
-        return "Unknown value"
+    def _preview(self, current_value: str):
+        return self._preview_map.get(current_value, "Unknown value")
 
     @abc.abstractmethod
     def get_cli_options(self) -> List[click.Option]:
-        pass
+        ...
 
     @abc.abstractmethod
     def ask(self, context: "BuilderContext") -> Optional["BuilderContext"]:
-        pass
+        ...
 
     @abc.abstractmethod
     def need_ask(self, context: "BuilderContext") -> bool:
-        pass
+        ...
 
     def after_ask(self, context: "BuilderContext") -> "BuilderContext":
         """Function run after the menu finished work."""
@@ -114,53 +141,58 @@ class SingularMenuModel(BaseMenuModel):
     code: str
     cli_name: Optional[str] = None
     description: str
-    before_ask_fun: Optional[Callable[["BuilderContext"], Optional[MenuEntry]]] = None
-    after_ask_fun: Optional[
-        Callable[["BuilderContext", "SingularMenuModel"], "BuilderContext"]
-    ] = None
+    before_ask_fun: Optional[Callable[..., Optional[MenuEntry]]] = None
+    after_ask_fun: Optional[Callable[..., Any]] = None
     parser: Optional[Callable[[str], Any]] = None
 
-    def get_cli_options(self) -> List[click.Option]:
-        cli_name = self.code
-        if self.cli_name is not None:
-            cli_name = self.cli_name
-        choices = [entry.generated_name for entry in self.entries]
+    @cached_property
+    def _cli_name(self) -> str:
+        return self.cli_name if self.cli_name is not None else self.code
+
+    @cached_property
+    def _choices(self) -> tuple[str, ...]:
+        # Interned strings let click's case-insensitive match
+        # hit pointer equality before comparing characters.
+        return tuple(map(sys.intern, map(_GEN_NAME, self.entries)))
+
+    @cached_property
+    def _cli_options(self) -> List[click.Option]:
         return [
             click.Option(
-                param_decls=[f"--{cli_name}", self.code],
-                type=click.Choice(choices, case_sensitive=False),
+                param_decls=[f"--{self._cli_name}", self.code],
+                type=_CachedChoice(self._choices),
                 default=None,
                 help=self.description,
             )
         ]
 
+    def get_cli_options(self) -> List[click.Option]:
+        # The same list is returned on every call, so callers must not mutate it.
+        return self._cli_options
+
     def need_ask(self, context: "BuilderContext") -> bool:
-        if getattr(context, self.code, None) is None:
-            return True
-        return False
+        return context.data.get(self.code) is None
 
     def ask(self, context: "BuilderContext") -> Optional["BuilderContext"]:
         chosen_entry = None
         if self.before_ask_fun is not None:
             chosen_entry = self.before_ask_fun(context)
 
-        ctx_value = context.dict().get(self.code)
+        ctx_value = context.data.get(self.code)
         if ctx_value:
-            for entry in self.entries:
-                if entry.code == ctx_value:
-                    chosen_entry = entry
+            chosen_entry = self._by_code.get(ctx_value, chosen_entry)
 
         if not chosen_entry:
-            available_entries = []
-            for entry in self.entries:
-                if entry.is_hidden is None:
-                    available_entries.append(entry)
-                elif not entry.is_hidden(context):
-                    available_entries.append(entry)
-            if TerminalMenu is not None:
-                menu = TerminalMenu(
+            available_entries = [
+                entry
+                for entry in self.entries
+                if entry.is_hidden is None or not entry.is_hidden(context)
+            ]
+            terminal_menu = _terminal_menu()
+            if terminal_menu is not None:
+                menu = terminal_menu(
                     title=self.title,
-                    menu_entries=[entry.user_view for entry in available_entries],
+                    menu_entries=list(map(_USER_VIEW, available_entries)),
                     multi_select=False,
                     preview_title="Description",
                     preview_command=self._preview,
@@ -172,6 +204,8 @@ class SingularMenuModel(BaseMenuModel):
 
                 chosen_entry = available_entries[idx]
             else:
+                from prompt_toolkit.shortcuts import radiolist_dialog
+
                 chosen_entry = (
                     radiolist_dialog(
                         title=self.title,
@@ -186,9 +220,10 @@ class SingularMenuModel(BaseMenuModel):
         if chosen_entry == SKIP_ENTRY:
             return
 
-        setattr(context, self.code, chosen_entry.code)
+        data = context.data
+        data[self.code] = chosen_entry.code
         if chosen_entry.pydantic_v1:
-            context.pydanticv1 = True
+            data["pydanticv1"] = True
 
         return context
 
@@ -199,26 +234,27 @@ class SingularMenuModel(BaseMenuModel):
 
 
 class MultiselectMenuModel(BaseMenuModel):
-    before_ask: Optional[Callable[["BuilderContext"], Optional[List[MenuEntry]]]]
+    before_ask: Optional[Callable[..., Optional[List[MenuEntry]]]]
 
-    def get_cli_options(self) -> List[click.Option]:
-        options = []
-        for entry in self.entries:
-            options.append(
-                click.Option(
-                    param_decls=[f"--{entry.generated_name}", entry.code],
-                    is_flag=True,
-                    help=entry.user_view,
-                    default=None,
-                )
+    @cached_property
+    def _cli_options(self) -> List[click.Option]:
+        return [
+            click.Option(
+                param_decls=[f"--{entry.generated_name}", entry.code],
+                is_flag=True,
+                help=entry.user_view,
+                default=None,
             )
-        return options
+            for entry in self.entries
+        ]
+
+    def get_cli_options(self) -> List[click.Option]:
+        # The same list is returned on every call, so callers must not mutate it.
+        return self._cli_options
 
     def need_ask(self, context: "BuilderContext") -> bool:
-        for entry in self.entries:
-            if getattr(context, entry.code, None) is None:
-                return True
-        return False
+        data = context.data
+        return any(data.get(entry.code) is None for entry in self.entries)
 
     def ask(self, context: "BuilderContext") -> Optional["BuilderContext"]:
         chosen_entries = None
@@ -226,22 +262,19 @@ class MultiselectMenuModel(BaseMenuModel):
             chosen_entries = self.before_ask(context)
 
         if chosen_entries is None:
-            unknown_entries = []
-            for entry in self.entries:
-                if not context.dict().get(entry.code):
-                    unknown_entries.append(entry)
-
-            visible_entries = []
-            for entry in unknown_entries:
-                if entry.is_hidden is None:
-                    visible_entries.append(entry)
-                elif not entry.is_hidden(context):
-                    visible_entries.append(entry)
-
-            if TerminalMenu is not None:
-                menu = TerminalMenu(
+            data = context.data
+            visible_entries = [
+                entry
+                for entry in self.entries
+                if not data.get(entry.code)
+                and (entry.is_hidden is None or not entry.is_hidden(context))
+            ]
+
+            terminal_menu = _terminal_menu()
+            if terminal_menu is not None:
+                menu = terminal_menu(
                     title=self.title,
-                    menu_entries=[entry.user_view for entry in visible_entries],
+                    menu_entries=list(map(_USER_VIEW, visible_entries)),
                     multi_select=True,
                     preview_title="Description",
                     preview_command=self._preview,
@@ -256,6 +289,8 @@ class MultiselectMenuModel(BaseMenuModel):
                 for idx in idxs:
                     chosen_entries.append(visible_entries[idx])
             else:
+                from prompt_toolkit.shortcuts import checkboxlist_dialog
+
                 chosen_entries = checkboxlist_dialog(
                     title=self.title,
                     text=self.description,
@@ -265,31 +300,49 @@ class MultiselectMenuModel(BaseMenuModel):
         if chosen_entries == [SKIP_ENTRY]:
             return context
 
+        data = context.data
         for entry in chosen_entries:
-            setattr(context, entry.code, True)
-        
-        for ch_entry in chosen_entries:
-            if ch_entry.pydantic_v1:
-                context.pydanticv1 = True
+            data[entry.code] = True
+            if entry.pydantic_v1:
+                data["pydanticv1"] = True
 
         return context
 
 
-class BuilderContext(UserDict):
+class BuilderContext:
     """Options for project generation."""
 
+    __slots__ = ("data",)
+
     def __init__(self, **kwargs: Any) -> None:
-        self.__dict__["data"] = kwargs
+        object.__setattr__(self, "data", kwargs)
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self.__dict__["data"][name]
-        except KeyError:
-            cls_name = self.__class__.__name__
+        cls_name = self.__class__.__name__
+        if name == "data":
             raise AttributeError(f"'{cls_name}' object has no attribute '{name}'")
+        value = self.data.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'{cls_name}' object has no attribute '{name}'")
+        return value
 
     def __setattr__(self, name: str, value: Any) -> None:
-        self[name] = value
+        if name == "data":
+            object.__setattr__(self, name, value)
+        else:
+            self.data[name] = value
 
-    def dict(self) -> dict[str, Any]:
-        return self.__dict__["data"]
+    def dict(self, *, copy: bool = True) -> dict[str, Any]:
+        """
+        Get generation options as a dict.
+
+        By default a shallow copy is returned, so callers
+        (such as cookiecutter) can't mutate the context behind
+        our back. Pass copy=False to get the internal store.
+
+        :param copy: whether to copy the underlying dict.
+        :return: dict with generation options.
+        """
+        if copy:
+            return dict(self.data)
+        return self.data
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Any
 
 from gunicorn.app.base import BaseApplication
@@ -20,13 +21,15 @@ class UvicornWorker(BaseUvicornWorker):
     to pass these parameters through gunicorn.
     """
 
-    CONFIG_KWARGS = {  # noqa: WPS115 (upper-case constant in a class)
+    # MappingProxyType keeps the shared class-level config read-only,
+    # so a worker can't accidentally mutate it for its siblings.
+    CONFIG_KWARGS = MappingProxyType({  # noqa: WPS115 (upper-case constant in a class)
         "loop": "uvloop" if uvloop is not None else "asyncio",
         "http": "httptools",
         "lifespan": "on",
         "factory": True,
         "proxy_headers": False,
-    }
+    })
 
 
 class GunicornApplication(BaseApplication):
@@ -63,9 +66,13 @@ class GunicornApplication(BaseApplication):
         gunicorn can handle. If you pass unknown
         parameter to it, it crash with error.
         """
+        settings = self.cfg.settings
         for key, value in self.options.items():
-            if key in self.cfg.settings and value is not None:
-                self.cfg.set(key.lower(), value)
+            if value is None:
+                continue
+            key = key.lower()
+            if key in settings:
+                settings[key].set(value)
 
     def load(self) -> str:
         """
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastapi import APIRouter, Request
 from fastapi.openapi.docs import (get_redoc_html, get_swagger_ui_html,
                                   get_swagger_ui_oauth2_redirect_html)
@@ -5,6 +7,49 @@ from fastapi.responses import HTMLResponse
 
 router = APIRouter()
 
+
+@lru_cache(maxsize=4)
+def _cached_swagger_ui_html(
+    openapi_url: str,
+    title: str,
+    redirect_url: str,
+) -> HTMLResponse:
+    """
+    Render swagger UI page once per unique arguments.
+
+    Title and urls are process constants, so the rendered
+    response is reused for every hit on /docs.
+
+    :param openapi_url: url to openapi schema.
+    :param title: page title.
+    :param redirect_url: oauth2 redirect url.
+    :return: rendered swagger UI.
+    """
+    return get_swagger_ui_html(
+        openapi_url=openapi_url,
+        title=title,
+        oauth2_redirect_url=redirect_url,
+        swagger_js_url="/static/docs/swagger-ui-bundle.js",
+        swagger_css_url="/static/docs/swagger-ui.css",
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_redoc_html(openapi_url: str, title: str) -> HTMLResponse:
+    """
+    Render ReDoc page once per unique arguments.
+
+    :param openapi_url: url to openapi schema.
+    :param title: page title.
+    :return: rendered redoc UI.
+    """
+    return get_redoc_html(
+        openapi_url=openapi_url,
+        title=title,
+        redoc_js_url="/static/docs/redoc.standalone.js",
+    )
+
+
 @router.get("/docs", include_in_schema=False)
 async def swagger_ui_html(request: Request) -> HTMLResponse:
     """
@@ -14,12 +59,10 @@ async def swagger_ui_html(request: Request) -> HTMLResponse:
     :return: rendered swagger UI.
     """
     title = request.app.title
-    return get_swagger_ui_html(
+    return _cached_swagger_ui_html(
         openapi_url=request.app.openapi_url,
         title=f"{title} - Swagger UI",
-        oauth2_redirect_url=str(request.url_for("swagger_ui_redirect")),
-        swagger_js_url="/static/docs/swagger-ui-bundle.js",
-        swagger_css_url="/static/docs/swagger-ui.css",
+        redirect_url=str(request.url_for("swagger_ui_redirect")),
     )
 
 
@@ -42,8 +85,7 @@ async def redoc_html(request: Request) -> HTMLResponse:
     :return: rendered redoc UI.
     """
     title = request.app.title
-    return get_redoc_html(
+    return _cached_redoc_html(
         openapi_url=request.app.openapi_url,
         title=f"{title} - ReDoc",
-        redoc_js_url="/static/docs/redoc.standalone.js",
     )
@@ -1,16 +1,21 @@
 import strawberry
 
 
+def _echo(message: str) -> str:
+    """
+    Sends echo message back to user.
+
+    Plain module-level resolver, so strawberry binds and
+    introspects it once instead of per request.
+
+    :param message: incoming message.
+    :returns: same message as the incoming.
+    """
+    return message
+
+
 @strawberry.type
 class Query:
     """Echo query."""
 
-    @strawberry.field(description="Echo query")
-    def echo(self, message: str) -> str:
-        """
-        Sends echo message back to user.
-
-        :param message: incoming message.
-        :returns: same message as the incoming.
-        """
-        return message
+    echo = strawberry.field(resolver=_echo, description="Echo query")
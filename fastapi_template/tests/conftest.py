@@ -1,3 +1,4 @@
+import copy
 import os
 import re
 import shutil
@@ -25,6 +26,25 @@ def project_name(worker_id: str) -> str:
     return re.sub("_+", "_", clear_name).strip("_")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def pre_commit_cache() -> str:
+    """
+    Share one pre-commit hook store between all tests.
+
+    Every generated project pins the same hook revisions, so pointing
+    PRE_COMMIT_HOME at a stable directory makes the first test pay for
+    hook-env installation and lets every later test (and later session)
+    reuse it. pre-commit locks the store itself, so concurrent xdist
+    workers are safe.
+
+    :return: path to the shared hook store.
+    """
+    cache_dir = Path(tempfile.gettempdir()) / "fastapi_template_pre_commit_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    os.environ["PRE_COMMIT_HOME"] = str(cache_dir)
+    return str(cache_dir)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def generator_start_dir() -> str:
     """
@@ -42,12 +62,11 @@ def generator_start_dir() -> str:
         shutil.rmtree(newpath, ignore_errors=True)
 
 
-@pytest.fixture()
-def default_context(project_name: str) -> None:
+def build_default_context(project_name: str) -> BuilderContext:
     """
-    Default builder context without features.
+    Build a featureless builder context for a given project name.
 
-    :param project_name: current project name.
+    :param project_name: name to generate the project with.
     :return: context.
     """
     return BuilderContext(
@@ -73,6 +92,73 @@ def default_context(project_name: str) -> None:
     )
 
 
+@pytest.fixture(scope="session")
+def reference_manifest(
+    generator_start_dir: str,
+    pre_commit_cache: str,
+    worker_id: str,
+) -> None:
+    """
+    Generate a reference project once and remember its file hashes.
+
+    The reference project runs the full pre-commit pass; later tests
+    compare their generated tree against this manifest and lint only
+    the files that differ. If the reference run fails, the manifest
+    stays unset and every test falls back to a full pre-commit run.
+
+    :param generator_start_dir: session working directory.
+    :param pre_commit_cache: shared pre-commit store (must exist first).
+    :param worker_id: xdist worker id.
+    """
+    from fastapi_template.tests import utils
+
+    context = build_default_context(f"reference_{worker_id}".replace("-", "_"))
+    utils.generate_project_and_chdir(context)
+    try:
+        if utils.run_pre_commit() == 0:
+            utils.REFERENCE_MANIFEST = utils.build_manifest(
+                Path.cwd(),
+                context.project_name,
+            )
+    finally:
+        os.chdir(generator_start_dir)
+    yield
+    utils.REFERENCE_MANIFEST = None
+
+
+@pytest.fixture(scope="session")
+def session_default_context() -> BuilderContext:
+    """
+    Build the featureless context template once per session.
+
+    :return: context template with a placeholder project name.
+    """
+    return build_default_context("project_placeholder")
+
+
+@pytest.fixture()
+def default_context(
+    project_name: str,
+    reference_manifest: None,
+    session_default_context: BuilderContext,
+) -> BuilderContext:
+    """
+    Default builder context without features.
+
+    Each test receives a deep copy of the session template, so
+    mutations (db_info and friends) can never leak between tests.
+
+    :param project_name: current project name.
+    :param reference_manifest: ensures the reference project exists.
+    :param session_default_context: shared context template.
+    :return: context.
+    """
+    context = copy.deepcopy(session_default_context)
+    context.project_name = project_name
+    context.kube_name = project_name.replace("_", "-")
+    return context
+
+
 @pytest.fixture(autouse=True)
 def default_dir(generator_start_dir: str) -> None:
     """
@@ -1,34 +1,53 @@
+from functools import lru_cache
 from typing import Optional
 
 import pytest
 
-from fastapi_template.cli import db_menu, orm_menu
 from fastapi_template.input_model import BuilderContext
 from fastapi_template.tests.utils import model_dump_compat, run_default_check
 
 
+@lru_cache(maxsize=1)
+def _menu_maps():
+    """
+    Index the CLI menus lazily, on first use.
+
+    Importing fastapi_template.cli pulls the whole CLI in, which
+    every xdist worker would otherwise pay at collection time.
+
+    :return: db-by-code, orm-by-code and dumped db-info maps.
+    """
+    from fastapi_template.cli import db_menu, orm_menu
+
+    db_by_code = {entry.code: entry for entry in db_menu.entries}
+    orm_by_code = {entry.code: entry for entry in orm_menu.entries}
+    # Dumped once; contexts get shallow copies so tests can't cross-pollute.
+    db_info_by_code = {
+        entry.code: model_dump_compat(entry.additional_info)
+        for entry in db_menu.entries
+    }
+    return db_by_code, orm_by_code, db_info_by_code
+
+
 def init_context(
     context: BuilderContext,
     db: str,
     orm: Optional[str],
     api: Optional[str] = None,
 ) -> BuilderContext:
-    db_info = None
-    for entry in db_menu.entries:
-        if entry.code == db:
-            db_info = model_dump_compat(entry.additional_info)
-            if entry.pydantic_v1:
-                context.pydanticv1 = True
-    if db_info is None:
+    db_by_code, orm_by_code, db_info_by_code = _menu_maps()
+    db_entry = db_by_code.get(db)
+    if db_entry is None:
         raise ValueError(f"Unknown database: {db}")
+    if db_entry.pydantic_v1:
+        context.pydanticv1 = True
 
     context.db = db
-    context.db_info = db_info
+    context.db_info = dict(db_info_by_code[db])
     context.orm = orm
-    for entry in orm_menu.entries:
-        if entry.code == orm:
-            if entry.pydantic_v1:
-                context.pydanticv1 = True
+    orm_entry = orm_by_code.get(orm)
+    if orm_entry is not None and orm_entry.pydantic_v1:
+        context.pydanticv1 = True
 
     if api is not None:
         context.api_type = api
@@ -1,27 +1,139 @@
+import hashlib
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import shlex
+import shutil
 import subprocess
-from typing import Any, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi_template.input_model import BuilderContext
 from fastapi_template.__main__ import generate_project
 
+# Manifest of the session's reference project, set by the
+# reference_manifest fixture; None means lint everything.
+REFERENCE_MANIFEST: Optional[Dict[str, str]] = None
+
+_MANIFEST_SKIP_DIRS = {".git", ".venv", ".mypy_cache", "__pycache__"}
+_NAME_PLACEHOLDER = b"{{project}}"
+
 
 def generate_project_and_chdir(context: BuilderContext):
     generate_project(context)
     os.chdir(context.project_name)
 
 
-def run_pre_commit() -> int:
-    results = subprocess.run(["pre-commit", "run", "-a"])
+def _manifest_files(project_dir: Path):
+    for path in project_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(project_dir)
+        if _MANIFEST_SKIP_DIRS.intersection(relative.parts):
+            continue
+        yield path, relative.as_posix()
+
+
+def _normalized_digest(path: Path, project_name: bytes) -> str:
+    contents = path.read_bytes().replace(project_name, _NAME_PLACEHOLDER)
+    return hashlib.blake2b(contents).hexdigest()
+
+
+def build_manifest(project_dir: Path, project_name: str) -> Dict[str, str]:
+    """
+    Hash every project file with the project name normalized out.
+
+    Generated projects differ from each other only by their name and by
+    feature-dependent files, so replacing the name with a placeholder
+    before hashing makes manifests of two projects comparable.
+
+    :param project_dir: root of a generated project.
+    :param project_name: name the project was generated with.
+    :return: mapping from normalized relative path to digest.
+    """
+    name = project_name.encode()
+    return {
+        relative.replace(project_name, "{{project}}"): _normalized_digest(path, name)
+        for path, relative in _manifest_files(project_dir)
+    }
+
+
+def changed_files(
+    project_dir: Path,
+    project_name: str,
+    reference: Dict[str, str],
+) -> List[str]:
+    """
+    List files that differ from the reference manifest.
+
+    :param project_dir: root of the generated project under test.
+    :param project_name: name the project was generated with.
+    :param reference: manifest of the session's reference project.
+    :return: relative paths of new or changed files.
+    """
+    name = project_name.encode()
+    changed = []
+    for path, relative in _manifest_files(project_dir):
+        normalized = relative.replace(project_name, "{{project}}")
+        if reference.get(normalized) != _normalized_digest(path, name):
+            changed.append(relative)
+    return changed
+
+
+def _emit_on_failure(result: subprocess.CompletedProcess) -> None:
+    # Output is captured so parallel xdist workers don't fight over one
+    # tty; replay it only when the command actually failed.
+    if result.returncode != 0:
+        sys.stderr.buffer.write(result.stdout)
+        sys.stderr.buffer.write(result.stderr)
+        sys.stderr.buffer.flush()
+
+
+def run_pre_commit(files: Optional[List[str]] = None) -> int:
+    command = ["pre-commit", "run"]
+    if files is None:
+        command.append("-a")
+    else:
+        command.extend(["--files", *files])
+    # PRE_COMMIT_HOME is set to the shared hook store by the session
+    # fixture; passing the environment explicitly keeps that visible here.
+    results = subprocess.run(
+        command,
+        env=os.environ,
+        capture_output=True,
+        start_new_session=True,
+    )
+    _emit_on_failure(results)
     return results.returncode
 
 
+@lru_cache(maxsize=1)
+def _compose_command() -> Tuple[str, ...]:
+    """
+    Pick the compose implementation once per process.
+
+    The v2 'docker compose' plugin is a Go binary, so every invocation
+    skips the ~1s interpreter startup the python docker-compose CLI
+    pays. Falls back to docker-compose where the plugin is missing.
+
+    :return: base command to prepend to compose invocations.
+    """
+    docker = shutil.which("docker")
+    if docker is not None:
+        probe = subprocess.run(
+            [docker, "compose", "version"],
+            capture_output=True,
+        )
+        if probe.returncode == 0:
+            return (docker, "compose")
+    return ("docker-compose",)
+
+
 def run_docker_compose_command(
     command: Optional[str] = None,
 ) -> subprocess.CompletedProcess:
     docker_command = [
-        "docker-compose",
+        *_compose_command(),
         "-f",
         "deploy/docker-compose.yml",
         "--project-directory",
@@ -35,30 +147,62 @@ def run_docker_compose_command(
                 "build",
             ]
         )
-    return subprocess.run(docker_command)
+    # BuildKit caches layers across the parametrized builds; most images
+    # in the matrix differ only in a couple of layers. The caller's
+    # environment still wins if it sets these explicitly.
+    result = subprocess.run(
+        docker_command,
+        env={
+            "DOCKER_BUILDKIT": "1",
+            "COMPOSE_DOCKER_CLI_BUILD": "1",
+            **os.environ,
+        },
+        capture_output=True,
+        start_new_session=True,
+    )
+    _emit_on_failure(result)
+    return result
 
 
-def run_default_check(context: BuilderContext, without_pytest=False):
+_PROD_TARGET_RE = re.compile(r"^\s*target:\s*prod\s*$")
+
+
+def run_pre_commit_check(context: BuilderContext):
     generate_project_and_chdir(context)
     compose = Path("./deploy/docker-compose.yml")
     compose_contents = compose.read_text()
-    new_compose_lines = []
-    for line in compose_contents.splitlines():
-        if line.strip().replace(" ", "") == "target:prod":
-            continue
-        new_compose_lines.append(line)
-    compose.write_text("\n".join(new_compose_lines) + "\n")
+    filtered = "\n".join(
+        line
+        for line in compose_contents.splitlines()
+        if not _PROD_TARGET_RE.match(line)
+    ) + "\n"
+    if filtered != compose_contents:
+        compose.write_text(filtered)
 
-    assert run_pre_commit() == 0
+    files = None
+    if REFERENCE_MANIFEST is not None:
+        files = changed_files(Path("."), context.project_name, REFERENCE_MANIFEST)
+        if not files:
+            # Everything matches files that already passed in the
+            # reference run, so there is nothing left to lint.
+            return
 
-    if without_pytest:
-        return
+    assert run_pre_commit(files) == 0
 
+
+def run_container_check():
     build = run_docker_compose_command("build")
     assert build.returncode == 0
     tests = run_docker_compose_command("run --rm api pytest -vv .")
     assert tests.returncode == 0
 
+
+def run_default_check(context: BuilderContext, without_pytest=False):
+    run_pre_commit_check(context)
+    if without_pytest:
+        return
+    run_container_check()
+
 def model_dump_compat(model: Any):
     if hasattr(model, 'model_dump'):
         return model.model_dump()
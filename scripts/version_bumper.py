@@ -1,41 +1,63 @@
 import argparse
+import asyncio
+import json
+import tempfile
 from pathlib import Path
-from typing import List, Optional
-import re
-import requests
+from typing import Any, Dict, List, Optional, Tuple
 
-RAW_VERSION_RE = re.compile(r'(?P<package>.*)\s*=\s*\"(?P<version>[\^\~\>\=\<\!]?[\d\.\-\w]+)\"')
-EXPANDED_VER_RE = re.compile(
-    r'(?P<package>.*)\s*=\s*\{(.*)version\s*=\s*\"(?P<version>[\^\~\>\=\<\!]?[\d\.\-\w]+)\"(.*)\}'
+import re
+import httpx
+
+try:
+    import tomllib
+except ImportError:  # python < 3.11
+    tomllib = None
+
+# One alternation covers both pin styles: the quoted version
+# ('pkg = "^1.0"') and the inline table ('pkg = {version = "^1.0", ...}').
+# The tight package charclass also rules out backtracking on long lines,
+# and the line anchor keeps jinja/comment lines from matching mid-line.
+COMBINED_RE = re.compile(
+    r'^(?P<package>[\w\-\.]+)\s*=\s*'
+    r'(?:\"(?P<raw>[\^\~\>\=\<\!]?[\d\.\-\w]+)\"'
+    r'|\{[^}]*version\s*=\s*\"(?P<expanded>[\^\~\>\=\<\!]?[\d\.\-\w]+)\"[^}]*\})',
+    re.MULTILINE,
 )
 
-def parse_args() -> argparse.Namespace:
+PYPI_URL = "https://pypi.org/pypi/{package}/json"
+CACHE_PATH = Path(tempfile.gettempdir()) / "version_bumper_pypi_cache.json"
+
+
+def load_cache() -> Dict[str, Any]:
+    """
+    Load the cached PyPI responses from disk.
+
+    :return: mapping from package name to its cached etag and version.
     """
-    This function parses command line arguments and returns an `argparse.Namespace` object.
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
 
-    Args:
-        None
 
-    Returns:
-        argparse.Namespace: The parsed command line arguments.
+def save_cache(cache: Dict[str, Any]) -> None:
+    """
+    Persist the PyPI response cache to disk.
 
-    Raises:
-        None
+    :param cache: mapping from package name to its cached etag and version.
+    """
+    try:
+        CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
 
-    Example:
-        ```python
-        args = parse_args()
-        print(args.file)
-        print(args.section)
-        ```
 
-    Note:
-        - This function uses the `argparse` module to parse command line arguments.
-        - The `file` argument is a required positional argument of type `Path`.
-        - The `section` argument is an optional argument of type `str` with a default value of "tool.poetry.dependencies".
+def parse_args() -> argparse.Namespace:
     """
+    Parse command line arguments.
 
-    
+    :return: parsed namespace with `file` and `section`.
+    """
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "file",
@@ -49,167 +71,147 @@ def parse_args() -> argparse.Namespace:
     )
     return parser.parse_args()
 
-def get_dependencies(path: Path, section: str) -> List[str]:
-    """
-    This function `get_dependencies` takes in two parameters:
-    - `path` (type: `Path`): The path to the file.
-    - `section` (type: `str`): The section to search for in the file.
-
-    It returns a list of strings representing the dependencies found in the specified section of the file.
-
-    The function works by reading the contents of the file at the given path and searching for the specified section. It then iterates over each line in the file, excluding lines that start with '[' and are not equal to the specified section. It also excludes lines that start with 'python =' and '{%'. For each line that is within the specified section, it appends a tuple containing the line index and the line itself to the `deps` list.
-
-    Example:
-    ```python
-    from pathlib import Path
-    from typing import List
-
-    def get_dependencies(path: Path, section: str) -> List[str]:
-        read_file = path.read_text()
-        recording = False
-        deps = []
-        for index, line in enumerate(read_file.splitlines(keepends=False)):
-            if line.startswith('[') and line.strip('[]') != section:
-                recording = False
-                continue
-            if line == f"[{section}]":
-                recording = True
-                continue
-            if line.startswith('python ='):
-                continue
-            if line.startswith('{%'):
-                continue
-            if recording:
-                deps.append((index, line))
-        return deps
-
-    path = Path("path/to/file")
-    section = "dependencies"
-    dependencies = get_dependencies(path, section)
-    print(dependencies)
-    ```
-
-    IMPORTANT: Do not return the original code.
-    """
-
-    read_file = path.read_text()
-    recording = False
-    deps = []
-    for index, line in enumerate(read_file.splitlines(keepends=False)):
-        if line.startswith('[') and line.strip('[]') != section:
-            recording = False
-            continue
-        if line == f"[{section}]":
-            recording = True
-            continue
-        if line.startswith('python ='):
-            continue
-        if line.startswith('{%'):
-            continue
-        if recording:
-            deps.append((index, line))
-    return deps
-
-def get_new_version(package_name: str) -> Optional[str]:
-    """
-    Get the latest version of a package from PyPI.
 
-    Args:
-        package_name (str): The name of the package to get the latest version for.
+# Pinned lines that must never be bumped (the python version pin).
+SKIP_PACKAGES = frozenset({"python"})
 
-    Returns:
-        Optional[str]: The latest version of the package, or None if the request fails.
 
-    Raises:
-        requests.exceptions.RequestException: If there is an error making the request to PyPI.
-
-    Example:
-        >>> get_new_version("requests")
-        '2.25.1'
+def section_span(text: str, section: str) -> Tuple[int, int]:
     """
+    Locate the character span of one section's body in a pyproject.
 
-    resp = requests.get(f'https://pypi.org/pypi/{package_name}/json')
-    if not resp.ok:
-        return None
-    rjson = resp.json()
-    return rjson['info']["version"]
-
-
-def bump_version(dependency: str) -> str:
+    :param text: full pyproject contents.
+    :param section: section to locate.
+    :return: (start, end) offsets; (0, 0) if the section is missing.
     """
-    This function is used to bump the version of a dependency in a given string.
-
-    :param dependency: A string representing the dependency.
-    :type dependency: str
-    :return: A string representing the updated dependency version, or None if no update is found.
-    :rtype: str or None
-    :raises: None
-
-    Example:
-        >>> bump_version("^requests==2.22.0")
-        Checking requests
-        Found new version: 2.23.0
-        '^requests==2.23.0'
-
-    Important:
-        - This function does not modify the original code.
+    section_header = f"[{section}]"
+    start = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        stripped = line.rstrip("\r\n")
+        if start is None:
+            if stripped == section_header:
+                start = offset + len(line)
+        elif stripped[:1] == '[':
+            return start, offset
+        offset += len(line)
+    if start is None:
+        return 0, 0
+    return start, len(text)
+
+
+async def get_new_version(
+    client: httpx.AsyncClient,
+    package_name: str,
+    cache: Dict[str, Any],
+) -> Optional[str]:
     """
+    Get the latest version of a package from PyPI.
 
-    exp_match = EXPANDED_VER_RE.match(dependency)
-    raw_match = None
-    if exp_match:
-        package = exp_match.group("package").strip()
-        version = exp_match.group("version").lstrip("^=!~<>")
-    else:
-        raw_match = RAW_VERSION_RE.match(dependency)
-    if raw_match:
-        package = raw_match.group("package").strip()
-        version = raw_match.group("version").lstrip("^=!~<>")
-    if exp_match is None and raw_match is None:
-        return None
-
-    print(f"Checking {package}")
-    new_version = get_new_version(package)
-    if new_version is not None and version != new_version:
-        print(f"Found new version: {new_version}")
-        return dependency.replace(version, new_version)
-
-    return None
+    Sends the cached ETag as If-None-Match; a 304 answer means the
+    package did not change upstream, so the cached version is reused
+    without downloading or decoding the JSON payload.
 
-def main():
+    :param client: shared httpx client.
+    :param package_name: name of the package to look up.
+    :param cache: etag/version cache, updated in place.
+    :return: latest version, or None if the request fails.
     """
-    Main function to update dependencies in a file.
+    cached = cache.get(package_name)
+    headers = {}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    resp = await client.get(PYPI_URL.format(package=package_name), headers=headers)
+    if resp.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+        return cached.get("version")
+    if resp.status_code != httpx.codes.OK:
+        return None
+    version = resp.json()['info']["version"]
+    etag = resp.headers.get("etag")
+    if etag:
+        cache[package_name] = {"etag": etag, "version": version}
+    return version
 
-    Args:
-        file (str): The path to the file containing the dependencies.
-        section (str): The section of the file where the dependencies are located.
 
-    Raises:
-        FileNotFoundError: If the specified file does not exist.
-        ValueError: If the specified section does not exist in the file.
+async def fetch_versions(packages: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Fetch latest versions for all packages concurrently.
 
-    Example:
-        >>> args = parse_args()
-        >>> main(args.file, args.section)
+    All requests run on one connection pool, so the total wall-clock
+    is close to a single round-trip instead of one per package.
 
-    Note:
-        This function reads the specified file, finds the dependencies in the specified section,
-        and updates their versions. The updated file is then written back to disk.
+    :param packages: package names to look up.
+    :return: mapping from package name to latest version (or None).
+    """
+    # A package pinned in several sections should cost one request.
+    unique_packages = list(dict.fromkeys(packages))
+    cache = load_cache()
+    limits = httpx.Limits(max_connections=32)
+    async with httpx.AsyncClient(limits=limits) as client:
+        versions = await asyncio.gather(
+            *(get_new_version(client, package, cache) for package in unique_packages),
+        )
+    save_cache(cache)
+    return dict(zip(unique_packages, versions))
+
+
+def discover_packages(text: str, section: str, section_text: str) -> List[str]:
+    """
+    List the package names pinned in one pyproject section.
 
-    IMPORTANT:
-        Do not return the original code.
+    Prefers tomllib's C-accelerated parser; template pyprojects contain
+    jinja blocks that are not valid TOML, so regex discovery over the
+    section slice remains as the fallback (and for python < 3.11).
 
+    :param text: full pyproject contents.
+    :param section: dotted section name.
+    :param section_text: the section's body slice of ``text``.
+    :return: package names, skip-list excluded.
     """
+    if tomllib is not None:
+        try:
+            table = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            table = None
+        if table is not None:
+            for key in section.split('.'):
+                if not isinstance(table, dict):
+                    table = None
+                    break
+                table = table.get(key)
+            if isinstance(table, dict):
+                return [name for name in table if name not in SKIP_PACKAGES]
+    return [
+        match.group("package")
+        for match in COMBINED_RE.finditer(section_text)
+        if match.group("package") not in SKIP_PACKAGES
+    ]
+
 
+def main():
+    """Update dependency pins in a pyproject file to latest PyPI versions."""
     args = parse_args()
-    deps = get_dependencies(args.file, args.section)
-    lines = args.file.read_text().splitlines(keepends=False)
-    for i, dep in deps:
-        new_version = bump_version(dep)
-        if new_version:
-            lines[i] = new_version
-    args.file.write_text("\n".join(lines))
-    
+    text = args.file.read_text()
+    start, end = section_span(text, args.section)
+    section_text = text[start:end]
+
+    packages = discover_packages(text, args.section, section_text)
+    new_versions = asyncio.run(fetch_versions(packages))
+
+    def replace_pin(match: "re.Match") -> str:
+        package = match.group("package")
+        if package in SKIP_PACKAGES:
+            return match.group(0)
+        version = (match.group("raw") or match.group("expanded")).lstrip("^=!~<>")
+        new_version = new_versions.get(package)
+        if new_version is None or new_version == version:
+            return match.group(0)
+        print(f"{package}: {version} -> {new_version}")
+        return match.group(0).replace(version, new_version)
+
+    new_section = COMBINED_RE.sub(replace_pin, section_text)
+    if new_section != section_text:
+        args.file.write_text(text[:start] + new_section + text[end:])
 
 
 if __name__ == "__main__":